@@ -1,7 +1,34 @@
-from typing import List
+import sys
+from typing import Dict, FrozenSet, Tuple
+
+from pydantic import PrivateAttr
 from pydantic_settings import BaseSettings
 
 
+# The valid provider names, interned so parsed entries share one string object
+_KNOWN_PROVIDERS = {name: sys.intern(name) for name in ("apollo", "rocketreach", "lusha", "prospeo", "snov")}
+
+
+def _parse_provider_order(raw: str) -> Tuple[str, ...]:
+    """Parse the comma-separated provider list into a tuple of names.
+
+    Scans with find() instead of str.split to skip the throwaway list, and
+    maps known names to their interned copies.
+    """
+    providers = []
+    i = 0
+    end = len(raw)
+    while i <= end:
+        j = raw.find(",", i)
+        if j == -1:
+            j = end
+        name = raw[i:j].strip()
+        if name:
+            providers.append(_KNOWN_PROVIDERS.get(name, name))
+        i = j + 1
+    return tuple(providers)
+
+
 class Settings(BaseSettings):
     # API Keys (all optional - providers without keys are disabled)
     apollo_api_key: str = ""
@@ -13,30 +40,53 @@ class Settings(BaseSettings):
     # Provider order (comma-separated, e.g., "apollo,rocketreach,prospeo")
     provider_order: str = "apollo,rocketreach,prospeo,snov"
 
+    # Max concurrent waterfall enrichments during bulk requests
+    bulk_concurrency: int = 10
+
+    # Number of providers raced concurrently per person (1 = strict waterfall;
+    # higher values trade extra provider spend for lower latency)
+    hedge_count: int = 1
+
+    # Max concurrent Snov.io enrichments (its multi-step submit/poll flow
+    # holds connections longer than the other providers)
+    snov_max_concurrency: int = 20
+
     # Server config
     port: int = 8000
     log_level: str = "INFO"
 
+    # Derived lookups, computed once at startup so the per-request path
+    # doesn't re-split strings or rebuild dicts
+    _provider_order: Tuple[str, ...] = PrivateAttr(default=())
+    _provider_set: FrozenSet[str] = PrivateAttr(default=frozenset())
+    _key_map: Dict[str, str] = PrivateAttr(default_factory=dict)
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
 
-    def get_provider_order(self) -> List[str]:
-        """Return list of enabled providers in order."""
-        return [p.strip() for p in self.provider_order.split(",") if p.strip()]
-
-    def is_provider_enabled(self, provider: str) -> bool:
-        """Check if provider is in the order list and has an API key."""
-        if provider not in self.get_provider_order():
-            return False
-        key_map = {
+    def model_post_init(self, __context) -> None:
+        self._provider_order = _parse_provider_order(self.provider_order)
+        self._provider_set = frozenset(self._provider_order)
+        self._key_map = {
             "apollo": self.apollo_api_key,
             "rocketreach": self.rocketreach_api_key,
             "lusha": self.lusha_api_key,
             "prospeo": self.prospeo_api_key,
             "snov": self.snov_api_key,
         }
-        return bool(key_map.get(provider, ""))
+
+    def get_provider_order(self) -> Tuple[str, ...]:
+        """Return enabled providers in order."""
+        return self._provider_order
+
+    def get_api_key(self, provider: str) -> str:
+        """Return the configured API key for a provider ("" if unset/unknown)."""
+        return self._key_map.get(provider, "")
+
+    def is_provider_enabled(self, provider: str) -> bool:
+        """Check if provider is in the order list and has an API key."""
+        return provider in self._provider_set and bool(self._key_map.get(provider))
 
 
 settings = Settings()
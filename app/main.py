@@ -1,5 +1,9 @@
 import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 
 from app.config import settings
 from app.schemas import (
@@ -12,8 +16,9 @@ from app.schemas import (
     HealthResponse,
     ApiKeys,
 )
-from app.services.enrichment import enrich_person, enrich_people_bulk
-from app.services import apollo, rocketreach, lusha, prospeo, snov
+from app.services.base import close_clients
+from app.services.enrichment import enrich_person, enrich_people_bulk, get_provider
+from app.services.enrichment import _get_api_key as _resolve_api_key
 
 
 logging.basicConfig(
@@ -23,28 +28,37 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Shared serializers for the enrichment response union. Endpoints dump through
+# these and pass response_model=None so FastAPI doesn't clone and revalidate
+# the union schema once per route at startup.
+ENRICH_RESPONSE_ADAPTER = TypeAdapter(EnrichmentResponse)
+BULK_RESPONSE_ADAPTER = TypeAdapter(BulkEnrichmentResponse)
+
+
+def _dump_enrichment(result: EnrichmentResponse) -> dict:
+    """Serialize an enrichment result through the shared adapter."""
+    return ENRICH_RESPONSE_ADAPTER.dump_python(result, mode="json")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Manage the shared provider HTTP clients for the app's lifetime."""
+    yield
+    await close_clients()
+
+
 app = FastAPI(
     title="Email Enrichment Service",
     description="Enrich person data with email addresses using multiple providers (Apollo, RocketReach, Lusha, Prospeo, Snov.io)",
     version="2.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
 def _get_api_key(provider: str, api_keys: ApiKeys = None) -> str:
     """Get API key for a provider from request or env."""
-    if api_keys:
-        user_key = getattr(api_keys, provider, None)
-        if user_key:
-            return user_key
-
-    env_key_map = {
-        "apollo": settings.apollo_api_key,
-        "rocketreach": settings.rocketreach_api_key,
-        "lusha": settings.lusha_api_key,
-        "prospeo": settings.prospeo_api_key,
-        "snov": settings.snov_api_key,
-    }
-    return env_key_map.get(provider, "")
+    return _resolve_api_key(provider, api_keys) or ""
 
 
 @app.get("/health", response_model=HealthResponse)
@@ -53,111 +67,87 @@ async def health_check() -> HealthResponse:
     return HealthResponse()
 
 
-@app.post("/enrich", response_model=EnrichmentResponse)
-async def enrich(request: EnrichmentRequest) -> EnrichmentResponse:
+@app.post("/enrich", response_model=None)
+async def enrich(request: EnrichmentRequest) -> dict:
     """
     Enrich a single person with their email address.
 
     Tries providers in configured order (waterfall) until one succeeds.
     Optionally accepts API keys and/or providers list to override defaults.
     """
-    logger.info(f"Enriching person: {request.person.linkedin_url}")
+    logger.info("Enriching person: %s", request.person.linkedin_url)
     result = await enrich_person(request.person, request.api_keys, request.providers)
 
     if result.success:
-        logger.info(f"Found email for {request.person.linkedin_url} via {result.source}")
+        logger.info("Found email for %s via %s", request.person.linkedin_url, result.source)
     else:
-        logger.info(f"No email found for {request.person.linkedin_url}: {result.error}")
+        logger.info("No email found for %s: %s", request.person.linkedin_url, result.error)
 
-    return result
+    return _dump_enrichment(result)
 
 
-@app.post("/enrich/simple", response_model=EnrichmentResponse)
-async def enrich_simple(person: PersonInput) -> EnrichmentResponse:
+@app.post("/enrich/simple", response_model=None)
+async def enrich_simple(person: PersonInput) -> dict:
     """
     Simple enrichment endpoint (backwards compatible).
     Does not accept API keys - uses environment defaults only.
     """
-    logger.info(f"Enriching person (simple): {person.linkedin_url}")
+    logger.info("Enriching person (simple): %s", person.linkedin_url)
     result = await enrich_person(person, None)
 
     if result.success:
-        logger.info(f"Found email for {person.linkedin_url} via {result.source}")
+        logger.info("Found email for %s via %s", person.linkedin_url, result.source)
     else:
-        logger.info(f"No email found for {person.linkedin_url}: {result.error}")
+        logger.info("No email found for %s: %s", person.linkedin_url, result.error)
 
-    return result
+    return _dump_enrichment(result)
 
 
-@app.post("/enrich/bulk", response_model=BulkEnrichmentResponse)
-async def enrich_bulk(request: BulkEnrichmentRequest) -> BulkEnrichmentResponse:
+@app.post("/enrich/bulk", response_model=None)
+async def enrich_bulk(request: BulkEnrichmentRequest) -> dict:
     """
     Enrich multiple people with their email addresses (max 10).
 
     Uses Apollo bulk API when available, with waterfall fallback for failures.
     Optionally accepts API keys and/or providers list to override defaults.
     """
-    logger.info(f"Bulk enriching {len(request.people)} people")
+    logger.info("Bulk enriching %d people", len(request.people))
     results = await enrich_people_bulk(request.people, request.api_keys, request.providers)
     success_count = sum(1 for r in results if r.success)
-    logger.info(f"Bulk enrichment complete: {success_count}/{len(results)} successful")
-    return BulkEnrichmentResponse(results=results)
+    logger.info("Bulk enrichment complete: %d/%d successful", success_count, len(results))
+    return BULK_RESPONSE_ADAPTER.dump_python(
+        BulkEnrichmentResponse.model_construct(results=results), mode="json"
+    )
 
 
 # ============================================================================
 # Individual Provider Endpoints (for testing)
 # ============================================================================
 
-@app.post("/enrich/apollo", response_model=EnrichmentResponse)
-async def enrich_apollo(request: EnrichmentRequest) -> EnrichmentResponse:
-    """Test Apollo provider directly."""
-    api_key = _get_api_key("apollo", request.api_keys)
-    if not api_key:
-        return EnrichmentError(error="auth_error", message="No Apollo API key configured", linkedin_url=request.person.linkedin_url)
-
-    logger.info(f"[Apollo] Enriching: {request.person.linkedin_url}")
-    return await apollo.enrich(request.person, api_key)
-
-
-@app.post("/enrich/rocketreach", response_model=EnrichmentResponse)
-async def enrich_rocketreach(request: EnrichmentRequest) -> EnrichmentResponse:
-    """Test RocketReach provider directly."""
-    api_key = _get_api_key("rocketreach", request.api_keys)
-    if not api_key:
-        return EnrichmentError(error="auth_error", message="No RocketReach API key configured", linkedin_url=request.person.linkedin_url)
-
-    logger.info(f"[RocketReach] Enriching: {request.person.linkedin_url}")
-    return await rocketreach.enrich(request.person, api_key)
-
-
-@app.post("/enrich/lusha", response_model=EnrichmentResponse)
-async def enrich_lusha(request: EnrichmentRequest) -> EnrichmentResponse:
-    """Test Lusha provider directly."""
-    api_key = _get_api_key("lusha", request.api_keys)
-    if not api_key:
-        return EnrichmentError(error="auth_error", message="No Lusha API key configured", linkedin_url=request.person.linkedin_url)
+_PROVIDER_LABELS = {
+    "apollo": "Apollo",
+    "rocketreach": "RocketReach",
+    "lusha": "Lusha",
+    "prospeo": "Prospeo",
+    "snov": "Snov.io",
+}
 
-    logger.info(f"[Lusha] Enriching: {request.person.linkedin_url}")
-    return await lusha.enrich(request.person, api_key)
 
+def _make_provider_endpoint(name: str, label: str):
+    """Build the direct-test endpoint for a single provider."""
 
-@app.post("/enrich/prospeo", response_model=EnrichmentResponse)
-async def enrich_prospeo(request: EnrichmentRequest) -> EnrichmentResponse:
-    """Test Prospeo provider directly."""
-    api_key = _get_api_key("prospeo", request.api_keys)
-    if not api_key:
-        return EnrichmentError(error="auth_error", message="No Prospeo API key configured", linkedin_url=request.person.linkedin_url)
+    async def endpoint(request: EnrichmentRequest) -> dict:
+        api_key = _get_api_key(name, request.api_keys)
+        if not api_key:
+            return _dump_enrichment(EnrichmentError(error="auth_error", message=f"No {label} API key configured", linkedin_url=request.person.linkedin_url))
 
-    logger.info(f"[Prospeo] Enriching: {request.person.linkedin_url}")
-    return await prospeo.enrich(request.person, api_key)
+        logger.info("[%s] Enriching: %s", label, request.person.linkedin_url)
+        return _dump_enrichment(await get_provider(name).enrich(request.person, api_key))
 
+    endpoint.__name__ = f"enrich_{name}"
+    endpoint.__doc__ = f"Test {label} provider directly."
+    return endpoint
 
-@app.post("/enrich/snov", response_model=EnrichmentResponse)
-async def enrich_snov(request: EnrichmentRequest) -> EnrichmentResponse:
-    """Test Snov.io provider directly."""
-    api_key = _get_api_key("snov", request.api_keys)
-    if not api_key:
-        return EnrichmentError(error="auth_error", message="No Snov.io API key configured", linkedin_url=request.person.linkedin_url)
 
-    logger.info(f"[Snov.io] Enriching: {request.person.linkedin_url}")
-    return await snov.enrich(request.person, api_key)
+for _name, _label in _PROVIDER_LABELS.items():
+    app.post(f"/enrich/{_name}", response_model=None)(_make_provider_endpoint(_name, _label))
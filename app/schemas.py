@@ -1,5 +1,5 @@
-from typing import List, Literal, Optional, Union
-from pydantic import BaseModel, Field
+from typing import Annotated, List, Literal, Optional, Union
+from pydantic import BaseModel, Field, model_validator
 
 
 # Provider sources
@@ -25,6 +25,16 @@ class PersonInput(BaseModel):
     title: Optional[str] = None
     phone: Optional[str] = None
 
+    @model_validator(mode="after")
+    def _split_name(self) -> "PersonInput":
+        # Fill first/last from the full name once at the input boundary, so
+        # providers don't each re-split it per enrichment
+        if not self.first_name and not self.last_name and self.name:
+            head, _, tail = self.name.strip().partition(" ")
+            self.first_name = head or None
+            self.last_name = tail.lstrip() or None
+        return self
+
 
 class EnrichmentRequest(BaseModel):
     """Single enrichment request with optional API keys."""
@@ -53,7 +63,12 @@ class EnrichmentError(BaseModel):
     linkedin_url: Optional[str] = None
 
 
-EnrichmentResponse = Union[EnrichmentSuccess, EnrichmentError]
+# Discriminated on the success tag so pydantic dispatches straight to the
+# right member instead of trying each variant in turn
+EnrichmentResponse = Annotated[
+    Union[EnrichmentSuccess, EnrichmentError],
+    Field(discriminator="success"),
+]
 
 
 class BulkEnrichmentRequest(BaseModel):
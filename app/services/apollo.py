@@ -1,23 +1,46 @@
+import asyncio
 from typing import Dict, List
 import httpx
-from app.schemas import PersonInput, EnrichmentResponse, EnrichmentError, ProviderSource
-from app.services.base import TIMEOUT, create_success, create_error, handle_http_error, parse_name
+import orjson
+from app.schemas import PersonInput, EnrichmentResponse, ProviderSource
+from app.services.base import get_client, cached_by_linkedin, create_success, create_error, handle_http_error, parse_name
 
 
 APOLLO_BASE_URL = "https://api.apollo.io/api/v1"
 PROVIDER_NAME: ProviderSource = "apollo"
 
+# Constant outer envelope of the bulk_match body, pre-serialized so each
+# request only encodes the per-person detail objects
+_BULK_ENVELOPE_PREFIX = b'{"reveal_personal_emails":true,"details":['
+_BULK_ENVELOPE_SUFFIX = b"]}"
+
+
+_BASE_HEADERS = {
+    "Content-Type": "application/json",
+    "Cache-Control": "no-cache",
+}
+
+# Headers are identical per API key, so build them once per key instead of
+# per request (keys are few - one per tenant - so the cache stays small)
+_HEADERS_BY_KEY: Dict[str, Dict[str, str]] = {}
+
 
 def _get_headers(api_key: str) -> Dict[str, str]:
-    return {
-        "Content-Type": "application/json",
-        "Cache-Control": "no-cache",
-        "X-Api-Key": api_key,
-    }
+    headers = _HEADERS_BY_KEY.get(api_key)
+    if headers is None:
+        headers = _HEADERS_BY_KEY.setdefault(api_key, {**_BASE_HEADERS, "X-Api-Key": api_key})
+    return headers
 
 
 def _build_payload(person: PersonInput) -> dict:
     """Map our schema to Apollo's expected fields."""
+    # Fast path: many callers only supply a LinkedIn URL
+    if not (person.first_name or person.last_name or person.name or person.company or person.domain):
+        return {
+            "linkedin_url": person.linkedin_url,
+            "reveal_personal_emails": True,
+        }
+
     payload: dict = {
         "linkedin_url": person.linkedin_url,
         "reveal_personal_emails": True,
@@ -60,65 +83,86 @@ def _parse_response(data: dict, linkedin_url: str) -> EnrichmentResponse:
     )
 
 
+@cached_by_linkedin(PROVIDER_NAME)
 async def enrich(person: PersonInput, api_key: str) -> EnrichmentResponse:
     """Enrich a single person via Apollo's people/match endpoint."""
     payload = _build_payload(person)
+    client = get_client(APOLLO_BASE_URL)
 
-    async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-        try:
-            response = await client.post(
-                f"{APOLLO_BASE_URL}/people/match",
-                headers=_get_headers(api_key),
-                json=payload,
-            )
+    try:
+        response = await client.post(
+            "/people/match",
+            headers=_get_headers(api_key),
+            content=orjson.dumps(payload),
+        )
 
-            if response.status_code != 200:
-                return handle_http_error(response.status_code, "Apollo", person.linkedin_url)
+        if response.status_code != 200:
+            return handle_http_error(response.status_code, "Apollo", person.linkedin_url)
+
+        return _parse_response(orjson.loads(response.content), person.linkedin_url)
+
+    except httpx.TimeoutException:
+        return create_error("api_error", "Apollo request timed out", person.linkedin_url)
+    except httpx.RequestError:
+        return create_error("api_error", "Apollo API unavailable", person.linkedin_url)
 
-            return _parse_response(response.json(), person.linkedin_url)
 
-        except httpx.TimeoutException:
-            return create_error("api_error", "Apollo request timed out", person.linkedin_url)
-        except httpx.RequestError:
-            return create_error("api_error", "Apollo API unavailable", person.linkedin_url)
+async def _enrich_singly(people: List[PersonInput], api_key: str) -> List[EnrichmentResponse]:
+    """Enrich people via parallel single match calls.
+
+    Fallback for when bulk_match is unavailable (e.g. plan or quota limits).
+    The calls share the pooled client, so they overlap on kept-alive
+    connections instead of running as ten serial round-trips.
+    """
+    return list(await asyncio.gather(*[enrich(person, api_key) for person in people]))
 
 
 async def enrich_bulk(people: List[PersonInput], api_key: str) -> List[EnrichmentResponse]:
     """Enrich multiple people via Apollo's bulk_match endpoint."""
     details = [_build_payload(person) for person in people]
+    client = get_client(APOLLO_BASE_URL)
+    body = b"".join(
+        (_BULK_ENVELOPE_PREFIX, b",".join(orjson.dumps(d) for d in details), _BULK_ENVELOPE_SUFFIX)
+    )
 
-    async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-        try:
-            response = await client.post(
-                f"{APOLLO_BASE_URL}/people/bulk_match",
-                headers=_get_headers(api_key),
-                json={"details": details, "reveal_personal_emails": True},
-            )
-
-            if response.status_code != 200:
+    try:
+        async with client.stream(
+            "POST",
+            "/people/bulk_match",
+            headers=_get_headers(api_key),
+            content=body,
+        ) as response:
+            if response.status_code == 401:
                 error = handle_http_error(response.status_code, "Apollo")
                 return [
-                    EnrichmentError(
-                        error=error.error,
-                        message=error.message,
-                        linkedin_url=person.linkedin_url,
-                    )
+                    create_error(error.error, error.message, person.linkedin_url)
                     for person in people
                 ]
 
-            data = response.json()
-            matches = data.get("matches", [])
-
-            results: List[EnrichmentResponse] = []
-            for i, person in enumerate(people):
-                if i < len(matches) and matches[i]:
-                    results.append(_parse_response({"person": matches[i]}, person.linkedin_url))
-                else:
-                    results.append(create_error("not_found", "No match found in Apollo", person.linkedin_url))
-
-            return results
-
-        except httpx.TimeoutException:
-            return [create_error("api_error", "Apollo request timed out", p.linkedin_url) for p in people]
-        except httpx.RequestError:
-            return [create_error("api_error", "Apollo API unavailable", p.linkedin_url) for p in people]
+            if response.status_code != 200:
+                # bulk_match rejected (quota/plan) - the single match endpoint
+                # may still work, so try it in parallel before giving up
+                return await _enrich_singly(people, api_key)
+
+            raw = await response.aread()
+
+        # Parse after the stream closes and drop the raw buffer before
+        # building results, so body bytes and result models don't peak
+        # in memory together
+        data = orjson.loads(raw)
+        del raw
+        matches = data.get("matches", [])
+
+        results: List[EnrichmentResponse] = []
+        for i, person in enumerate(people):
+            if i < len(matches) and matches[i]:
+                results.append(_parse_response({"person": matches[i]}, person.linkedin_url))
+            else:
+                results.append(create_error("not_found", "No match found in Apollo", person.linkedin_url))
+
+        return results
+
+    except httpx.TimeoutException:
+        return [create_error("api_error", "Apollo request timed out", p.linkedin_url) for p in people]
+    except httpx.RequestError:
+        return [create_error("api_error", "Apollo API unavailable", p.linkedin_url) for p in people]
@@ -1,8 +1,139 @@
-from typing import Optional
+import asyncio
+import functools
+import sys
+from typing import Dict, Optional
+
+import httpx
+from cachetools import TTLCache
+
 from app.schemas import PersonInput, EnrichmentSuccess, EnrichmentError, ProviderSource
 
 
-TIMEOUT = 30.0
+# Shared timeout with explicit per-stage budgets: fail fast on connect
+# problems while allowing slow provider reads
+TIMEOUT = httpx.Timeout(connect=3.0, read=25.0, write=10.0, pool=5.0)
+
+# Interned copies of the small fixed literal sets, so every response shares
+# one string object per value instead of allocating fresh ones
+_SOURCES = {s: sys.intern(s) for s in ("apollo", "rocketreach", "lusha", "prospeo", "snov")}
+_ERRORS = {e: sys.intern(e) for e in ("not_found", "rate_limit", "auth_error", "api_error", "validation_error")}
+
+# Shared connection pool settings for all provider clients
+LIMITS = httpx.Limits(max_keepalive_connections=50, max_connections=100, keepalive_expiry=60.0)
+
+# One pooled client per provider base URL, created lazily and closed on app shutdown
+_clients: Dict[str, httpx.AsyncClient] = {}
+
+
+def get_client(base_url: str, timeout: httpx.Timeout = TIMEOUT) -> httpx.AsyncClient:
+    """Get the shared pooled client for a provider base URL, creating it on first use.
+
+    Reusing one client per provider keeps connections alive across requests,
+    so repeat calls skip the TCP + TLS handshake. HTTP/2 lets concurrent
+    calls to the same provider multiplex over one connection (httpx falls
+    back to HTTP/1.1 for hosts without h2 support).
+    """
+    client = _clients.get(base_url)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=LIMITS, http2=True)
+        _clients[base_url] = client
+    return client
+
+
+# Provider responses cached per (provider, linkedin_url). Hits skip the
+# upstream round-trip (and its vendor spend) entirely. Successes are kept
+# for a day; not_found results use a short negative TTL in case the
+# provider's data catches up.
+SUCCESS_CACHE_TTL = 86_400.0
+NOT_FOUND_CACHE_TTL = 300.0
+_success_cache: TTLCache = TTLCache(maxsize=100_000, ttl=SUCCESS_CACHE_TTL)
+_not_found_cache: TTLCache = TTLCache(maxsize=100_000, ttl=NOT_FOUND_CACHE_TTL)
+
+# In-flight lookups keyed like the caches, so concurrent duplicates share
+# one upstream call instead of each paying for their own
+_inflight: Dict[str, asyncio.Future] = {}
+
+
+@functools.lru_cache(maxsize=200_000)
+def normalize_linkedin_url(url: str) -> str:
+    """Canonicalize a LinkedIn URL (memoized per distinct input).
+
+    Drops the query/fragment and trailing slash and lowercases the scheme
+    and host, so the same profile produces one string for every provider
+    call and cache key. The path keeps its case since profile slugs are
+    user-defined.
+    """
+    url = url.strip()
+    for sep in ("?", "#"):
+        if sep in url:
+            url = url.split(sep, 1)[0]
+    url = url.rstrip("/")
+    head, sep, tail = url.partition("://")
+    if sep:
+        host, slash, path = tail.partition("/")
+        url = f"{head.lower()}://{host.lower()}"
+        if slash:
+            url = f"{url}/{path}"
+    return url
+
+
+def cached_by_linkedin(provider: str):
+    """Decorator caching a provider's enrich() results by LinkedIn URL."""
+
+    def decorator(enrich_fn):
+        @functools.wraps(enrich_fn)
+        async def wrapper(person: PersonInput, api_key: str):
+            key = f"{provider}:{person.linkedin_url.lower().rstrip('/')}"
+            cached = _success_cache.get(key)
+            if cached is None:
+                cached = _not_found_cache.get(key)
+            if cached is not None:
+                return cached
+
+            # Single-flight: if the same lookup is already in flight, await
+            # the leader's result instead of issuing a duplicate call
+            existing = _inflight.get(key)
+            if existing is not None:
+                try:
+                    return await asyncio.shield(existing)
+                except asyncio.CancelledError:
+                    if not existing.cancelled():
+                        raise  # we were cancelled, not the leader
+                    # The leader was cancelled (e.g. lost a hedge race);
+                    # fall through and make our own call
+
+            future = asyncio.get_running_loop().create_future()
+            _inflight[key] = future
+            try:
+                result = await enrich_fn(person, api_key)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as exc:
+                future.set_exception(exc)
+                future.exception()  # mark retrieved in case nobody is waiting
+                raise
+            finally:
+                _inflight.pop(key, None)
+
+            future.set_result(result)
+            if result.success:
+                _success_cache[key] = result
+            elif result.error == "not_found":
+                _not_found_cache[key] = result
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+async def close_clients() -> None:
+    """Close all shared provider clients (called on app shutdown)."""
+    for client in _clients.values():
+        if not client.is_closed:
+            await client.aclose()
+    _clients.clear()
 
 
 def create_success(
@@ -13,14 +144,19 @@ def create_success(
     title: Optional[str] = None,
     company: Optional[str] = None,
 ) -> EnrichmentSuccess:
-    """Create a standardized success response."""
-    return EnrichmentSuccess(
+    """Create a standardized success response.
+
+    Uses model_construct since these are built from trusted internal values;
+    validation only runs on the input boundary.
+    """
+    return EnrichmentSuccess.model_construct(
+        success=True,
         email=email,
         name=name,
         title=title,
         company=company,
         linkedin_url=linkedin_url,
-        source=source,
+        source=_SOURCES.get(source, source),
     )
 
 
@@ -29,9 +165,10 @@ def create_error(
     message: str,
     linkedin_url: Optional[str] = None,
 ) -> EnrichmentError:
-    """Create a standardized error response."""
-    return EnrichmentError(
-        error=error_type,
+    """Create a standardized error response (model_construct, same as create_success)."""
+    return EnrichmentError.model_construct(
+        success=False,
+        error=_ERRORS.get(error_type, error_type),
         message=message,
         linkedin_url=linkedin_url,
     )
@@ -47,14 +184,21 @@ def handle_http_error(status_code: int, provider: str, linkedin_url: Optional[st
         return create_error("api_error", f"{provider} API error (HTTP {status_code})", linkedin_url)
 
 
+@functools.lru_cache(maxsize=1024)
+def _split_full_name(name: str) -> tuple:
+    """Split a full name into (first_name, last_name); memoized since bulk
+    runs often repeat the same names."""
+    # partition avoids the throwaway list that split(maxsplit=1) builds
+    head, _, tail = name.strip().partition(" ")
+    return head or None, tail.lstrip() or None
+
+
 def parse_name(person: PersonInput) -> tuple:
     """Extract first_name and last_name, parsing from name if needed."""
     first_name = person.first_name
     last_name = person.last_name
 
     if not first_name and not last_name and person.name:
-        parts = person.name.strip().split(maxsplit=1)
-        first_name = parts[0] if parts else None
-        last_name = parts[1] if len(parts) > 1 else None
+        first_name, last_name = _split_full_name(person.name)
 
     return first_name, last_name
@@ -1,88 +1,275 @@
+import asyncio
+import importlib
 import logging
-from typing import Dict, List, Optional, Callable, Awaitable
+import operator
+from types import ModuleType
+from typing import Callable, Dict, List, Optional, Tuple
+from cachetools import TTLCache
+
 from app.config import settings
 from app.schemas import PersonInput, EnrichmentResponse, EnrichmentError, ApiKeys
-from app.services import apollo, rocketreach, lusha, prospeo, snov
+from app.services.base import create_error, normalize_linkedin_url
 
 
 logger = logging.getLogger(__name__)
 
 
-# Provider registry mapping name to enrich function
-PROVIDERS: Dict[str, Callable[[PersonInput, str], Awaitable[EnrichmentResponse]]] = {
-    "apollo": apollo.enrich,
-    "rocketreach": rocketreach.enrich,
-    "lusha": lusha.enrich,
-    "prospeo": prospeo.enrich,
-    "snov": snov.enrich,
-}
+# Known provider module names; modules are imported lazily so a deployment
+# with only one configured provider doesn't pay import cost for all five
+PROVIDER_NAMES = ("apollo", "rocketreach", "lusha", "prospeo", "snov")
+
+_provider_modules: Dict[str, ModuleType] = {}
+
+# C-level accessors for ApiKeys fields, built once so the per-request key
+# lookup skips Python-level getattr dispatch
+_API_KEY_ATTRS = {name: operator.attrgetter(name) for name in PROVIDER_NAMES}
+
+# Providers that returned auth_error for a given key are skipped for a few
+# minutes: a revoked key fails every call, so retrying it per person just
+# adds a full provider timeout to every waterfall. (Per-URL not_found
+# results are already negatively cached at the provider layer.) Values are
+# the error message only - the response is rebuilt per person so it never
+# carries another person's linkedin_url.
+AUTH_ERROR_TTL = 300.0
+_auth_failures: TTLCache = TTLCache(maxsize=1024, ttl=AUTH_ERROR_TTL)
+
+
+def get_provider(name: str) -> Optional[ModuleType]:
+    """Import and cache a provider module on first use (None if unknown)."""
+    module = _provider_modules.get(name)
+    if module is None and name in PROVIDER_NAMES:
+        module = importlib.import_module(f"app.services.{name}")
+        _provider_modules[name] = module
+    return module
+
+
+# Configured provider order resolved to (name, enrich_fn) pairs once, so the
+# per-person hot path iterates a flat tuple instead of re-doing registry and
+# membership lookups. Built lazily to keep provider imports deferred; settings
+# are process-lifetime constants so it never needs invalidation.
+_ordered_providers: Optional[Tuple[Tuple[str, Callable], ...]] = None
+
+
+def _get_ordered_providers() -> Tuple[Tuple[str, Callable], ...]:
+    global _ordered_providers
+    if _ordered_providers is None:
+        _ordered_providers = _resolve_providers(settings.get_provider_order())
+    return _ordered_providers
+
+
+def _resolve_providers(provider_order) -> Tuple[Tuple[str, Callable], ...]:
+    """Resolve provider names to (name, enrich_fn) pairs, dropping unknowns."""
+    pairs = []
+    for name in provider_order:
+        provider = get_provider(name)
+        if provider is None:
+            logger.warning("Unknown provider: %s", name)
+            continue
+        pairs.append((name, provider.enrich))
+    return tuple(pairs)
 
 
 def _get_api_key(provider: str, user_keys: Optional[ApiKeys]) -> Optional[str]:
     """Get API key for provider, preferring user-provided key over env default."""
     # Check user-provided keys first
     if user_keys:
-        user_key = getattr(user_keys, provider, None)
+        getter = _API_KEY_ATTRS.get(provider)
+        user_key = getter(user_keys) if getter else None
         if user_key:
             return user_key
 
     # Fall back to environment keys
-    env_key_map = {
-        "apollo": settings.apollo_api_key,
-        "rocketreach": settings.rocketreach_api_key,
-        "lusha": settings.lusha_api_key,
-        "prospeo": settings.prospeo_api_key,
-        "snov": settings.snov_api_key,
-    }
-    return env_key_map.get(provider) or None
+    return settings.get_api_key(provider) or None
+
+
+class _Done(Exception):
+    """Carries the first successful result out of a hedged TaskGroup."""
+
+    def __init__(self, result: EnrichmentResponse) -> None:
+        self.result = result
+
+
+async def _race_providers(
+    person: PersonInput,
+    candidates: List[tuple],
+    attempts: List[str],
+) -> Optional[EnrichmentResponse]:
+    """Run several providers concurrently and return the first success.
+
+    The TaskGroup guarantees the losing lookups are cancelled (and their
+    sockets reclaimed) before this returns; if all complete without
+    success, the last error is returned. Outcomes are appended to attempts
+    (in completion order) for the caller's summary log line.
+    """
+    last_error: Optional[EnrichmentResponse] = None
+
+    async def _attempt(provider_name: str, enrich_fn: Callable, api_key: str) -> None:
+        nonlocal last_error
+        result = await enrich_fn(person, api_key)
+        if result.success:
+            attempts.append(f"{provider_name}:success")
+            raise _Done(result)
+        logger.debug("%s failed: %s - %s", provider_name, result.error, result.message)
+        attempts.append(f"{provider_name}:{result.error}")
+        if result.error == "auth_error":
+            _auth_failures[(provider_name, api_key)] = result.message
+        last_error = result
+
+    winner: Optional[EnrichmentResponse] = None
+    try:
+        async with asyncio.TaskGroup() as tg:
+            for provider_name, enrich_fn, api_key in candidates:
+                tg.create_task(_attempt(provider_name, enrich_fn, api_key))
+    except* _Done as done:
+        winner = done.exceptions[0].result
+
+    return winner if winner is not None else last_error
+
+
+class _AdmissionController:
+    """Adaptive concurrency limiter for bulk enrichment.
+
+    Behaves like a semaphore, but the limit can be re-tuned live: a
+    rate-limited result shrinks it, and a run of successes grows it back
+    toward the configured ceiling. A Condition + counter is used instead of
+    asyncio.Semaphore because the latter's internal count can't be safely
+    mutated after creation.
+    """
+
+    # Consecutive successes required before raising the limit by one
+    _GROWTH_WINDOW = 10
+
+    def __init__(self, limit: int) -> None:
+        self._limit = limit
+        self._ceiling = limit
+        self._active = 0
+        self._cond = asyncio.Condition()
+        self._successes = 0
+
+    async def __aenter__(self) -> None:
+        async with self._cond:
+            while self._active >= self._limit:
+                await self._cond.wait()
+            self._active += 1
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+    def record(self, result: EnrichmentResponse) -> None:
+        """Adjust the limit based on an enrichment outcome.
+
+        Raised limits take effect as in-flight slots are released; lowered
+        limits stop new admissions immediately.
+        """
+        if result.success:
+            self._successes += 1
+            if self._successes >= self._GROWTH_WINDOW and self._limit < self._ceiling:
+                self._successes = 0
+                self._limit += 1
+        elif result.error == "rate_limit":
+            self._successes = 0
+            if self._limit > 1:
+                self._limit -= 1
+
+
+def _resolve_keys(provider_order, api_keys: Optional[ApiKeys]) -> Dict[str, Optional[str]]:
+    """Resolve every provider's API key once for reuse across a batch."""
+    return {name: _get_api_key(name, api_keys) for name in provider_order}
 
 
 async def enrich_person(
     person: PersonInput,
     api_keys: Optional[ApiKeys] = None,
     providers: Optional[List[str]] = None,
+    resolved_keys: Optional[Dict[str, Optional[str]]] = None,
 ) -> EnrichmentResponse:
     """
     Enrich a person using waterfall strategy.
-    Tries each enabled provider in order until one succeeds.
+    Tries each enabled provider in order until one succeeds; with
+    hedge_count > 1 the top providers are raced concurrently first.
+
+    Bulk callers pass resolved_keys so per-provider key lookup happens once
+    per batch instead of once per person.
     """
-    provider_order = providers if providers else settings.get_provider_order()
-    last_error: Optional[EnrichmentError] = None
+    # Normalize the URL once here so every provider (and its cache) sees the
+    # same canonical string
+    if person.linkedin_url:
+        person.linkedin_url = normalize_linkedin_url(person.linkedin_url)
+
+    pairs = _resolve_providers(providers) if providers else _get_ordered_providers()
+    if resolved_keys is None:
+        resolved_keys = _resolve_keys([name for name, _ in pairs], api_keys)
+
+    # Per-provider outcomes are collected here and emitted as one summary
+    # record, rather than paying for 2 log calls per provider per person
+    attempts: List[str] = []
+    last_error: Optional[EnrichmentResponse] = None
+    final: Optional[EnrichmentResponse] = None
 
-    for provider_name in provider_order:
-        # Get API key (user-provided or env default)
-        api_key = _get_api_key(provider_name, api_keys)
+    # Resolve usable (name, enrich_fn, api_key) candidates up front
+    candidates = []
+    for provider_name, enrich_fn in pairs:
+        api_key = resolved_keys.get(provider_name)
 
         if not api_key:
-            logger.debug(f"Skipping {provider_name}: no API key")
+            logger.debug("Skipping %s: no API key", provider_name)
             continue
 
-        if provider_name not in PROVIDERS:
-            logger.warning(f"Unknown provider: {provider_name}")
+        # Circuit-break keys that recently failed auth instead of paying a
+        # guaranteed-to-fail round-trip per person
+        cached_message = _auth_failures.get((provider_name, api_key))
+        if cached_message is not None:
+            attempts.append(f"{provider_name}:auth_error(cached)")
+            last_error = create_error("auth_error", cached_message, person.linkedin_url)
             continue
 
-        enrich_fn = PROVIDERS[provider_name]
+        candidates.append((provider_name, enrich_fn, api_key))
 
-        logger.info(f"Trying {provider_name} for {person.linkedin_url}")
-        result = await enrich_fn(person, api_key)
+    if settings.hedge_count > 1 and len(candidates) > 1:
+        # Hedge: race the top providers, then fall back to the rest serially
+        racers, candidates = candidates[: settings.hedge_count], candidates[settings.hedge_count:]
+        logger.debug("Racing %d providers for %s", len(racers), person.linkedin_url)
+        result = await _race_providers(person, racers, attempts)
+        if result is not None:
+            if result.success:
+                final = result
+            else:
+                last_error = result
 
-        if result.success:
-            logger.info(f"Success from {provider_name} for {person.linkedin_url}")
-            return result
+    if final is None:
+        for provider_name, enrich_fn, api_key in candidates:
+            logger.debug("Trying %s for %s", provider_name, person.linkedin_url)
+            result = await enrich_fn(person, api_key)
 
-        logger.info(f"{provider_name} failed: {result.error} - {result.message}")
-        last_error = result
+            if result.success:
+                attempts.append(f"{provider_name}:success")
+                final = result
+                break
 
-    # All providers failed
-    if last_error:
-        return last_error
+            logger.debug("%s failed: %s - %s", provider_name, result.error, result.message)
+            attempts.append(f"{provider_name}:{result.error}")
+            if result.error == "auth_error":
+                _auth_failures[(provider_name, api_key)] = result.message
+            last_error = result
 
-    return EnrichmentError(
-        success=False,
-        error="not_found",
-        message="No providers available or all providers failed",
-        linkedin_url=person.linkedin_url,
+    if final is None:
+        # All providers failed (or none were available)
+        final = last_error or EnrichmentError(
+            success=False,
+            error="not_found",
+            message="No providers available or all providers failed",
+            linkedin_url=person.linkedin_url,
+        )
+
+    logger.info(
+        "Enrichment %s for %s (%s)",
+        "succeeded" if final.success else "failed",
+        person.linkedin_url,
+        ", ".join(attempts) if attempts else "no providers attempted",
     )
+    return final
 
 
 async def enrich_people_bulk(
@@ -95,27 +282,61 @@ async def enrich_people_bulk(
     For bulk, we only use Apollo (which has native bulk support).
     Falls back to individual enrichment if Apollo fails or is disabled.
     """
+    # Short-circuit degenerate inputs before any client/payload setup
+    if not people:
+        return []
+    if len(people) == 1:
+        return [await enrich_person(people[0], api_keys, providers)]
+
     provider_order = providers if providers else settings.get_provider_order()
     apollo_key = _get_api_key("apollo", api_keys)
 
+    # Resolve keys once for the whole batch rather than once per person
+    resolved_keys = _resolve_keys(provider_order, api_keys)
+
+    # Bound concurrent waterfalls so bulk requests don't stampede providers;
+    # the limit adapts down on rate limits and recovers on sustained success
+    admit = _AdmissionController(settings.bulk_concurrency)
+
+    async def _bounded_enrich(person: PersonInput) -> EnrichmentResponse:
+        async with admit:
+            result = await enrich_person(person, api_keys, providers, resolved_keys=resolved_keys)
+        admit.record(result)
+        return result
+
     if apollo_key and "apollo" in provider_order:
         # Try Apollo bulk first
-        logger.info(f"Trying Apollo bulk for {len(people)} people")
-        results = await apollo.enrich_bulk(people, apollo_key)
+        logger.info("Trying Apollo bulk for %d people", len(people))
+        results = await get_provider("apollo").enrich_bulk(people, apollo_key)
 
-        # Check if any failed - for those, try waterfall
-        final_results: List[EnrichmentResponse] = []
+        # Retry failed rows through the waterfall concurrently; successes
+        # pass straight through
+        tasks = []
         for i, result in enumerate(results):
             if result.success:
-                final_results.append(result)
+                tasks.append(asyncio.sleep(0, result=result))
             else:
-                # Try waterfall for failed ones
-                logger.info(f"Apollo bulk failed for {people[i].linkedin_url}, trying waterfall")
-                waterfall_result = await enrich_person(people[i], api_keys, providers)
-                final_results.append(waterfall_result)
+                logger.info("Apollo bulk failed for %s, trying waterfall", people[i].linkedin_url)
+                tasks.append(_bounded_enrich(people[i]))
+    else:
+        # No Apollo, enrich everyone concurrently - bulk latency approaches
+        # the slowest single person instead of the sum of all of them
+        logger.info("No Apollo bulk, enriching %d people individually", len(people))
+        tasks = [_bounded_enrich(person) for person in people]
 
-        return final_results
+    gathered = await asyncio.gather(*tasks, return_exceptions=True)
+    return [
+        result if not isinstance(result, BaseException) else _unexpected_error(people[i], result)
+        for i, result in enumerate(gathered)
+    ]
 
-    # No Apollo, do individual enrichment for each
-    logger.info(f"No Apollo bulk, enriching {len(people)} people individually")
-    return [await enrich_person(person, api_keys, providers) for person in people]
+
+def _unexpected_error(person: PersonInput, exc: BaseException) -> EnrichmentError:
+    """Convert an unexpected enrichment exception into an error response."""
+    logger.error("Enrichment failed for %s: %s", person.linkedin_url, exc)
+    return EnrichmentError(
+        success=False,
+        error="api_error",
+        message=f"Unexpected error: {exc}",
+        linkedin_url=person.linkedin_url,
+    )
@@ -1,20 +1,76 @@
-from typing import Dict
+import functools
+from types import MappingProxyType
+from typing import Dict, Mapping
 import httpx
+import orjson
 from app.schemas import PersonInput, EnrichmentResponse, ProviderSource
-from app.services.base import TIMEOUT, create_success, create_error, handle_http_error, parse_name
+from app.services.base import get_client, cached_by_linkedin, create_success, create_error, handle_http_error, parse_name
 
 
 LUSHA_BASE_URL = "https://api.lusha.com"
 PROVIDER_NAME: ProviderSource = "lusha"
 
 
-def _get_headers(api_key: str) -> Dict[str, str]:
-    return {
+@functools.lru_cache(maxsize=16)
+def _get_headers(api_key: str) -> Mapping[str, str]:
+    # One frozen headers mapping per API key; shared across requests
+    return MappingProxyType({
         "Content-Type": "application/json",
         "api_key": api_key,
-    }
-
-
+    })
+
+
+def _parse_response(data: dict, linkedin_url: str) -> EnrichmentResponse:
+    """Parse Lusha response into our schema."""
+    # Lusha response structure: {contact: {data: {...}, error: {...}}}
+    contact = data.get("contact", data)
+
+    # Check for error in response
+    error_info = contact.get("error")
+    if error_info:
+        error_name = error_info.get("name", "")
+        if error_name == "EMPTY_DATA":
+            return create_error("not_found", "No match found in Lusha", linkedin_url)
+        elif error_name == "COMPLIANCE_CONTACT_ERROR":
+            return create_error("not_found", "Contact restricted by compliance in Lusha", linkedin_url)
+        elif error_name:
+            return create_error("api_error", f"Lusha error: {error_name}", linkedin_url)
+
+    person_data = contact.get("data") or data.get("data", data)
+
+    if not person_data:
+        return create_error("not_found", "No profile data in Lusha response", linkedin_url)
+
+    # Extract email from emailAddresses array, preferring the work address
+    email_addresses = person_data.get("emailAddresses", [])
+    email = next(
+        (e.get("email") for e in email_addresses if e.get("type") == "work"),
+        None,
+    ) or (email_addresses[0].get("email") if email_addresses else None)
+
+    if not email:
+        return create_error("not_found", "No email found in Lusha", linkedin_url)
+
+    full_name = person_data.get("fullName") or f"{person_data.get('firstName', '')} {person_data.get('lastName', '')}".strip()
+
+    # Company is a dict in the common case; EAFP keeps that path branch-free
+    company_data = person_data.get("company")
+    try:
+        company_name = company_data.get("name")
+    except AttributeError:
+        company_name = company_data if isinstance(company_data, str) else None
+
+    return create_success(
+        email=email,
+        linkedin_url=linkedin_url,
+        source=PROVIDER_NAME,
+        name=full_name or None,
+        title=person_data.get("jobTitle"),
+        company=company_name,
+    )
+
+
+@cached_by_linkedin(PROVIDER_NAME)
 async def enrich(person: PersonInput, api_key: str) -> EnrichmentResponse:
     """Enrich a person via Lusha's person endpoint."""
     # Build query parameters
@@ -36,72 +92,21 @@ async def enrich(person: PersonInput, api_key: str) -> EnrichmentResponse:
     if person.domain:
         params["companyDomain"] = person.domain
 
-    async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-        try:
-            response = await client.get(
-                f"{LUSHA_BASE_URL}/v2/person",
-                headers=_get_headers(api_key),
-                params=params,
-            )
-
-            if response.status_code != 200:
-                return handle_http_error(response.status_code, "Lusha", person.linkedin_url)
-
-            data = response.json()
-
-            # Lusha response structure: {contact: {data: {...}, error: {...}}}
-            contact = data.get("contact", data)
-
-            # Check for error in response
-            error_info = contact.get("error")
-            if error_info:
-                error_name = error_info.get("name", "")
-                if error_name == "EMPTY_DATA":
-                    return create_error("not_found", "No match found in Lusha", person.linkedin_url)
-                elif error_name == "COMPLIANCE_CONTACT_ERROR":
-                    return create_error("not_found", "Contact restricted by compliance in Lusha", person.linkedin_url)
-                elif error_name:
-                    return create_error("api_error", f"Lusha error: {error_name}", person.linkedin_url)
-
-            person_data = contact.get("data") or data.get("data", data)
-
-            if not person_data:
-                return create_error("not_found", "No profile data in Lusha response", person.linkedin_url)
-
-            # Extract email from emailAddresses array
-            email = None
-            email_addresses = person_data.get("emailAddresses", [])
-            if email_addresses:
-                # Prefer work email
-                for e in email_addresses:
-                    if e.get("type") == "work":
-                        email = e.get("email")
-                        break
-                if not email:
-                    email = email_addresses[0].get("email")
-
-            if not email:
-                return create_error("not_found", "No email found in Lusha", person.linkedin_url)
-
-            full_name = person_data.get("fullName") or f"{person_data.get('firstName', '')} {person_data.get('lastName', '')}".strip()
-
-            company_data = person_data.get("company")
-            company_name = None
-            if isinstance(company_data, dict):
-                company_name = company_data.get("name")
-            elif isinstance(company_data, str):
-                company_name = company_data
-
-            return create_success(
-                email=email,
-                linkedin_url=person.linkedin_url,
-                source=PROVIDER_NAME,
-                name=full_name or None,
-                title=person_data.get("jobTitle"),
-                company=company_name,
-            )
-
-        except httpx.TimeoutException:
-            return create_error("api_error", "Lusha request timed out", person.linkedin_url)
-        except httpx.RequestError:
-            return create_error("api_error", "Lusha API unavailable", person.linkedin_url)
+    client = get_client(LUSHA_BASE_URL)
+
+    try:
+        response = await client.get(
+            "/v2/person",
+            headers=_get_headers(api_key),
+            params=params,
+        )
+
+        if response.status_code != 200:
+            return handle_http_error(response.status_code, "Lusha", person.linkedin_url)
+
+        return _parse_response(orjson.loads(response.content), person.linkedin_url)
+
+    except httpx.TimeoutException:
+        return create_error("api_error", "Lusha request timed out", person.linkedin_url)
+    except httpx.RequestError:
+        return create_error("api_error", "Lusha API unavailable", person.linkedin_url)
@@ -1,166 +1,441 @@
 import asyncio
-from typing import Dict, Optional
+import functools
+import random
+import re
+import time
+from collections import defaultdict
+from types import MappingProxyType
+from typing import DefaultDict, Dict, Mapping, Optional, Tuple
 import httpx
+import orjson
+from cachetools import TTLCache
+from app.config import settings
 from app.schemas import PersonInput, EnrichmentResponse, ProviderSource
-from app.services.base import TIMEOUT, create_success, create_error, handle_http_error
+from app.services.base import TIMEOUT, get_client, cached_by_linkedin, create_success, create_error, handle_http_error
 
 
 SNOV_BASE_URL = "https://api.snov.io"
 PROVIDER_NAME: ProviderSource = "snov"
-MAX_POLL_ATTEMPTS = 10
-POLL_INTERVAL = 2.0  # seconds
+
+# Poll schedule: start fast so quick tasks return in ~0.25s, then back off
+# toward a cap. The loop is bounded by a wall-clock deadline rather than an
+# attempt count, so the time budget stays explicit regardless of how the
+# backoff paces the attempts. Each sleep gets up to 20% jitter to
+# de-synchronize concurrent pollers.
+MAX_POLL_SECONDS = 30.0
+_POLL_BASE_DELAY = 0.25
+_POLL_MAX_DELAY = 5.0
+
+
+async def _poll_sleep(delay: float) -> None:
+    await asyncio.sleep(delay + random.uniform(0.0, 0.2 * delay))
+
+# Longer read budget than the shared default: enrichment is a multi-step
+# submit-and-poll process
+SNOV_TIMEOUT = httpx.Timeout(connect=3.0, read=55.0, write=10.0, pool=5.0)
+
+# Access tokens cached per api_key as (token, monotonic expiry). Tokens are
+# valid for ~1 hour, so re-minting one per enrichment was a wasted round-trip.
+# Locks are per key: a refresh for one tenant's key shouldn't serialize
+# refreshes for every other key behind it.
+TOKEN_EXPIRY_MARGIN = 60.0  # refresh this many seconds before actual expiry
+_token_cache: Dict[str, Tuple[str, float]] = {}
+_token_locks: DefaultDict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+class _TokenExpired(Exception):
+    """Raised when Snov rejects a cached access token (HTTP 401)."""
+
+
+def _get_cached_token(api_key: str) -> Optional[str]:
+    cached = _token_cache.get(api_key)
+    if cached and time.monotonic() < cached[1] - TOKEN_EXPIRY_MARGIN:
+        return cached[0]
+    return None
+
+
+def _invalidate_token(api_key: str) -> None:
+    _token_cache.pop(api_key, None)
 
 
 async def _get_access_token(api_key: str) -> Optional[str]:
-    """Snov.io uses OAuth - exchange API key (client_id:client_secret) for access token."""
+    """Snov.io uses OAuth - exchange API key (client_id:client_secret) for access token.
+
+    Tokens are cached until shortly before expiry; the per-key lock keeps
+    concurrent enrichments from minting duplicate tokens without blocking
+    refreshes for unrelated keys.
+    """
+    token = _get_cached_token(api_key)
+    if token:
+        return token
+
     parts = api_key.split(":")
     if len(parts) != 2:
         return None
 
     client_id, client_secret = parts
 
-    async with httpx.AsyncClient(timeout=TIMEOUT) as client:
+    async with _token_locks[api_key]:
+        # Another coroutine may have refreshed while we waited
+        token = _get_cached_token(api_key)
+        if token:
+            return token
+
+        # Same pooled client as enrichment, so OAuth + start + polls all ride
+        # one keep-alive connection; the tighter shared read budget applies
+        # per-request since a token POST should never take 55s
+        client = get_client(SNOV_BASE_URL, timeout=SNOV_TIMEOUT)
         try:
             response = await client.post(
-                f"{SNOV_BASE_URL}/v1/oauth/access_token",
-                json={
+                "/v1/oauth/access_token",
+                content=orjson.dumps({
                     "grant_type": "client_credentials",
                     "client_id": client_id,
                     "client_secret": client_secret,
-                },
+                }),
+                headers={"Content-Type": "application/json"},
+                timeout=TIMEOUT,
             )
             if response.status_code == 200:
-                return response.json().get("access_token")
-        except Exception:
+                data = orjson.loads(response.content)
+                token = data.get("access_token")
+                if token:
+                    expires_in = float(data.get("expires_in", 3600))
+                    _token_cache[api_key] = (token, time.monotonic() + expires_in)
+                return token
+        except (httpx.HTTPError, asyncio.TimeoutError):
+            # Transport failures mean "no token right now"; anything else
+            # is a bug and should propagate
             pass
     return None
 
 
-async def _get_profile_from_linkedin(client: httpx.AsyncClient, access_token: str, linkedin_url: str) -> Optional[Dict]:
-    """Get profile data (name, company) from LinkedIn URL."""
+async def _with_token_retry(api_key: str, op):
+    """Run op(access_token), refreshing the token and retrying once on 401.
+
+    The cached token is used optimistically with no validation round-trip;
+    only an actual rejection from Snov (any start or result call raising
+    _TokenExpired) triggers the refresh. Raises _TokenExpired when no valid
+    token can be obtained at all.
+    """
+    access_token = await _get_access_token(api_key)
+    if not access_token:
+        raise _TokenExpired()
     try:
+        return await op(access_token)
+    except _TokenExpired:
+        _invalidate_token(api_key)
+        access_token = await _get_access_token(api_key)
+        if not access_token:
+            raise
+        return await op(access_token)
+
+
+def _data_items(payload: Dict) -> list:
+    """Normalize a completed task payload's data field to a list."""
+    items = payload.get("data", [])
+    return items if isinstance(items, list) else [items]
+
+
+@functools.lru_cache(maxsize=128)
+def _get_headers(access_token: str) -> Mapping[str, str]:
+    # One frozen headers mapping per token; shared across submit + polls
+    return MappingProxyType({"Authorization": f"Bearer {access_token}"})
+
+
+async def _submit_and_poll(
+    client: httpx.AsyncClient,
+    access_token: str,
+    start_path: str,
+    result_path: str,
+    data: Optional[Dict] = None,
+    content: Optional[bytes] = None,
+) -> Optional[list]:
+    """Submit a Snov async task and poll its result endpoint.
+
+    Both task flavors share the same shape (POST start -> task_hash -> GET
+    result until completed), so the submit/poll mechanics live here once.
+    Returns the completed task's data items as a list, or None if the task
+    never completed. Raises _TokenExpired on a 401 from either endpoint.
+    """
+    headers = _get_headers(access_token)
+    if content is not None:
         start_response = await client.post(
-            f"{SNOV_BASE_URL}/v2/li-profiles-by-urls/start",
-            headers={"Authorization": f"Bearer {access_token}"},
-            data={"urls[]": linkedin_url},
+            start_path,
+            headers={**headers, "Content-Type": "application/json"},
+            content=content,
         )
+    else:
+        start_response = await client.post(start_path, headers=headers, data=data)
 
-        if start_response.status_code not in (200, 202):
-            return None
+    if start_response.status_code == 401:
+        raise _TokenExpired()
 
-        start_data = start_response.json()
-        task_hash = start_data.get("task_hash") or start_data.get("data", {}).get("task_hash")
-
-        if not task_hash:
-            return None
-
-        # Poll for results
-        for _ in range(MAX_POLL_ATTEMPTS):
-            await asyncio.sleep(POLL_INTERVAL)
-
-            result_response = await client.get(
-                f"{SNOV_BASE_URL}/v2/li-profiles-by-urls/result",
-                headers={"Authorization": f"Bearer {access_token}"},
-                params={"task_hash": task_hash},
-            )
+    # API returns 200 or 202 (Accepted) for async tasks
+    if start_response.status_code not in (200, 202):
+        return None
 
-            if result_response.status_code != 200:
-                continue
+    start_data = orjson.loads(start_response.content)
 
-            result_data = result_response.json()
-            status = result_data.get("status")
+    # A 200 can carry the finished result inline - check before committing
+    # to any poll sleeps
+    if start_response.status_code == 200 and start_data.get("status") == "completed":
+        return _data_items(start_data)
 
-            if status == "in_progress":
-                continue
+    task_hash = start_data.get("task_hash") or start_data.get("data", {}).get("task_hash")
 
-            if status == "completed":
-                data_items = result_data.get("data", [])
-                if data_items:
-                    item = data_items[0] if isinstance(data_items, list) else data_items
-                    return item.get("result", item)
+    if not task_hash:
+        return None
 
+    params = {"task_hash": task_hash}
+
+    # Conditional polling: once we have an ETag, repeated "in_progress"
+    # responses come back as bodyless 304s. The body digest is a fallback
+    # for the same skip when the server doesn't honor ETags.
+    etag: Optional[str] = None
+    last_digest: Optional[int] = None
+    # Rebuilt only when the ETag changes, not per iteration
+    poll_headers: Mapping[str, str] = headers
+
+    # Poll for results: GET first so a task that finished during submission
+    # is picked up immediately, and sleep only when still in progress
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + MAX_POLL_SECONDS
+    delay = _POLL_BASE_DELAY
+    while True:
+        result_response = await client.get(result_path, headers=poll_headers, params=params)
+
+        if result_response.status_code == 401:
+            raise _TokenExpired()
+
+        if result_response.status_code == 200:
+            new_etag = result_response.headers.get("etag")
+            if new_etag and new_etag != etag:
+                etag = new_etag
+                poll_headers = {**headers, "If-None-Match": etag}
+
+            body = result_response.content
+            digest = hash(body)
+            # A cheap byte scan over the head of the body beats a full JSON
+            # parse for the common still-in-progress case
+            if digest != last_digest and b'"in_progress"' not in body[:128]:
+                result_data = orjson.loads(body)
+                status = result_data.get("status")
+
+                if status == "completed":
+                    return _data_items(result_data)
+
+                if status != "in_progress":
+                    break
+            last_digest = digest
+
+        # 304, transient error, duplicate body, or still in progress:
+        # back off before the next poll, never past the deadline
+        remaining = deadline - loop.time()
+        if remaining <= 0:
             break
-
-    except Exception:
-        pass
+        await _poll_sleep(min(delay, remaining))
+        delay = min(delay * 2, _POLL_MAX_DELAY)
 
     return None
 
 
-async def _find_email_by_name_domain(client: httpx.AsyncClient, access_token: str, first_name: str, last_name: str, domain: str) -> Optional[str]:
-    """Find email using name + company domain."""
-    try:
-        start_response = await client.post(
-            f"{SNOV_BASE_URL}/v2/emails-by-domain-by-name/start",
-            headers={
-                "Authorization": f"Bearer {access_token}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "rows": [{
-                    "first_name": first_name,
-                    "last_name": last_name,
-                    "domain": domain,
-                }]
-            },
-        )
+# Batch window for profile lookups: Snov's start endpoint accepts repeated
+# urls[], so concurrent enrichments arriving within the window share one
+# task (and one poll cycle) instead of each running their own
+_BATCH_WINDOW = 0.05  # seconds
+_BATCH_MAX = 50  # URLs per submitted task
 
-        # API returns 200 or 202 (Accepted) for async tasks
-        if start_response.status_code not in (200, 202):
-            return None
 
-        start_data = start_response.json()
-        task_hash = start_data.get("data", {}).get("task_hash") or start_data.get("task_hash")
+class _BatchCoalescer:
+    """Coalesces concurrent profile lookups into shared Snov tasks.
 
-        if not task_hash:
-            return None
+    Callers submit (client, token, url, future) and await the future; a
+    lazily started worker drains the queue in windows of up to _BATCH_MAX
+    URLs, submits one task per access token, polls it once, and demuxes
+    the per-URL results back to the waiting futures.
+    """
 
-        # Poll for results
-        for _ in range(MAX_POLL_ATTEMPTS):
-            await asyncio.sleep(POLL_INTERVAL)
+    def __init__(self) -> None:
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        # Strong refs to in-flight batch tasks so they aren't GC'd mid-poll
+        self._batches: set = set()
+
+    async def fetch(self, client: httpx.AsyncClient, access_token: str, linkedin_url: str) -> Optional[Dict]:
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((client, access_token, linkedin_url, future))
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain())
+        return await future
+
+    async def _drain(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                first = await asyncio.wait_for(self._queue.get(), timeout=1.0)
+            except asyncio.TimeoutError:
+                # A fetch() can enqueue between the timeout cancelling the
+                # getter and this coroutine resuming; it would see the worker
+                # as not done and never restart it. Checking the queue here is
+                # synchronous with the task finishing, so returning only when
+                # it is empty closes that window.
+                if not self._queue.empty():
+                    continue
+                return  # idle; the next fetch() restarts the worker
+
+            batch = [first]
+            deadline = loop.time() + _BATCH_WINDOW
+            while len(batch) < _BATCH_MAX:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # One task per access token; mixed-tenant batches split here.
+            # Batches run as detached tasks so the drain loop keeps forming
+            # new ones while earlier batches are still polling - a slow task
+            # must not serialize every later caller behind it
+            groups: Dict[str, list] = {}
+            for item in batch:
+                groups.setdefault(item[1], []).append(item)
+            for items in groups.values():
+                task = asyncio.create_task(self._run_batch(items))
+                self._batches.add(task)
+                task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, items: list) -> None:
+        client, access_token = items[0][0], items[0][1]
+        urls = [item[2] for item in items]
+        try:
+            profiles = await self._fetch_profiles(client, access_token, urls)
+        except (httpx.HTTPError, asyncio.TimeoutError):
+            # Expected failure modes resolve everyone to "no profile"
+            profiles = {}
+        except Exception as exc:
+            # _TokenExpired and unexpected errors propagate to the waiting
+            # callers (so each can refresh-and-retry) rather than being
+            # silently flattened into not_found
+            for _, _, _, future in items:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for _, _, url, future in items:
+            if not future.done():
+                future.set_result(profiles.get(url.lower().rstrip("/")))
+
+    async def _fetch_profiles(self, client: httpx.AsyncClient, access_token: str, urls: list) -> Dict[str, Dict]:
+        data_items = await _submit_and_poll(
+            client,
+            access_token,
+            "/v2/li-profiles-by-urls/start",
+            "/v2/li-profiles-by-urls/result",
+            data={"urls[]": urls},
+        )
+        if not data_items:
+            return {}
+        return self._map_results(urls, data_items)
+
+    @staticmethod
+    def _map_results(urls: list, data_items: list) -> Dict[str, Dict]:
+        """Key profiles by normalized URL, falling back to submission order
+        for rows that don't echo the URL back.
+
+        The positional fallback is only trusted when the row count matches
+        the submission exactly; if Snov dropped rows for failed URLs,
+        position no longer identifies the person, and misattributing one
+        person's profile (and the email derived from it) to another is far
+        worse than a miss.
+        """
+        positions_align = len(data_items) == len(urls)
+        profiles: Dict[str, Dict] = {}
+        for i, item in enumerate(data_items):
+            result = item.get("result", item)
+            url = item.get("url") or item.get("source_url")
+            if not url and positions_align:
+                url = urls[i]
+            if url and result:
+                profiles[url.lower().rstrip("/")] = result
+        return profiles
+
+
+_profile_batcher = _BatchCoalescer()
+
+# Profile data for a URL rarely changes within the hour; caching it lets
+# repeated enrichments (CRM re-scans) skip the full submit + poll cycle
+# and the Snov credits it costs
+PROFILE_CACHE_TTL = 3600.0
+_profile_cache: TTLCache = TTLCache(maxsize=10_000, ttl=PROFILE_CACHE_TTL)
 
-            result_response = await client.get(
-                f"{SNOV_BASE_URL}/v2/emails-by-domain-by-name/result",
-                headers={"Authorization": f"Bearer {access_token}"},
-                params={"task_hash": task_hash},
-            )
 
-            if result_response.status_code != 200:
-                continue
+async def _get_profile_from_linkedin(client: httpx.AsyncClient, access_token: str, linkedin_url: str) -> Optional[Dict]:
+    """Get profile data (name, company) from LinkedIn URL.
 
-            result_data = result_response.json()
-            status = result_data.get("status")
+    Results are cached per URL for an hour; misses coalesce into shared
+    batched tasks (see _BatchCoalescer).
+    """
+    key = linkedin_url.lower().rstrip("/")
+    cached = _profile_cache.get(key)
+    if cached is not None:
+        return cached
 
-            if status == "in_progress":
-                continue
+    profile = await _profile_batcher.fetch(client, access_token, linkedin_url)
+    if profile is not None:
+        _profile_cache[key] = profile
+    return profile
 
-            if status == "completed":
-                data_items = result_data.get("data", [])
-                if data_items:
-                    item = data_items[0] if isinstance(data_items, list) else data_items
-                    results = item.get("result", [])
-                    if results:
-                        return results[0].get("email")
 
-            break
+async def _find_email_by_name_domain(client: httpx.AsyncClient, access_token: str, first_name: str, last_name: str, domain: str) -> Optional[str]:
+    """Find email using name + company domain.
 
-    except Exception:
-        pass
+    Transport errors and _TokenExpired propagate; enrich() handles both.
+    """
+    data_items = await _submit_and_poll(
+        client,
+        access_token,
+        "/v2/emails-by-domain-by-name/start",
+        "/v2/emails-by-domain-by-name/result",
+        content=orjson.dumps({
+            "rows": [{
+                "first_name": first_name,
+                "last_name": last_name,
+                "domain": domain,
+            }]
+        }),
+    )
+
+    if data_items:
+        results = data_items[0].get("result", [])
+        if results:
+            return results[0].get("email")
 
     return None
 
 
+# Strips the protocol and www. prefix and captures up to the first slash
+# (or port), in one pass instead of a chain of str.replace allocations. The
+# capture requires a dotted hostname so degenerate inputs like "https://"
+# map to None instead of junk being submitted as a domain.
+_DOMAIN_RE = re.compile(r"^(?:https?://)?(?:www\.)?([^/:]+\.[^/:]+)")
+
+
 def _extract_domain_from_url(url: str) -> Optional[str]:
     """Extract domain from company URL."""
     if not url:
         return None
-    # Remove protocol
-    domain = url.replace("https://", "").replace("http://", "").replace("www.", "")
-    # Remove path
-    domain = domain.split("/")[0]
-    return domain if domain else None
+    match = _DOMAIN_RE.match(url)
+    return match.group(1) if match else None
 
 
+# Caps concurrent enrichments: each one is a long submit/poll flow, so an
+# unbounded burst would thrash the connection pool and invite 429s
+_enrich_sem = asyncio.Semaphore(settings.snov_max_concurrency)
+
+
+@cached_by_linkedin(PROVIDER_NAME)
 async def enrich(person: PersonInput, api_key: str) -> EnrichmentResponse:
     """
     Enrich a person via Snov.io's API.
@@ -169,78 +444,90 @@ async def enrich(person: PersonInput, api_key: str) -> EnrichmentResponse:
     1. Get profile data from LinkedIn URL (name, company)
     2. Find email using name + company domain
     """
-    access_token = await _get_access_token(api_key)
-    if not access_token:
-        return create_error("auth_error", "Invalid Snov.io API credentials", person.linkedin_url)
+    async with _enrich_sem:
+        return await _enrich(person, api_key)
 
-    async with httpx.AsyncClient(timeout=60.0) as client:  # Longer timeout for multi-step process
-        try:
-            # Step 1: Get profile from LinkedIn URL
-            profile = await _get_profile_from_linkedin(client, access_token, person.linkedin_url)
-
-            # Extract name - prefer from profile, fall back to input
-            first_name = None
-            last_name = None
-            company_domain = None
-
-            if profile:
-                first_name = profile.get("first_name")
-                last_name = profile.get("last_name")
-
-                # Get company domain from positions
-                positions = profile.get("positions", [])
-                if positions:
-                    company_url = positions[0].get("url")
-                    company_domain = _extract_domain_from_url(company_url)
-
-            # Fall back to input data if profile didn't have info
-            if not first_name and person.first_name:
-                first_name = person.first_name
-            if not last_name and person.last_name:
-                last_name = person.last_name
-            if not first_name and not last_name and person.name:
-                parts = person.name.strip().split(maxsplit=1)
-                first_name = parts[0] if parts else None
-                last_name = parts[1] if len(parts) > 1 else None
-
-            # Fall back to input domain
-            if not company_domain and person.domain:
-                company_domain = person.domain
-
-            if not first_name or not last_name:
-                return create_error("not_found", "Could not determine name from Snov.io profile", person.linkedin_url)
-
-            if not company_domain:
-                return create_error("not_found", "Could not determine company domain from Snov.io profile", person.linkedin_url)
-
-            # Step 2: Find email using name + domain
-            email = await _find_email_by_name_domain(client, access_token, first_name, last_name, company_domain)
-
-            if not email:
-                return create_error("not_found", "No email found in Snov.io", person.linkedin_url)
-
-            # Build full name
-            full_name = f"{first_name} {last_name}".strip()
-
-            # Extract title and company from profile
-            title = None
-            company = None
-            if profile:
-                positions = profile.get("positions", [])
-                if positions:
-                    title = positions[0].get("title")
-                    company = positions[0].get("name")
-
-            return create_success(
-                email=email,
-                linkedin_url=person.linkedin_url,
-                source=PROVIDER_NAME,
-                name=full_name or None,
-                title=title,
-                company=company,
+
+async def _enrich(person: PersonInput, api_key: str) -> EnrichmentResponse:
+    client = get_client(SNOV_BASE_URL, timeout=SNOV_TIMEOUT)
+
+    try:
+        # Step 1: Get profile from LinkedIn URL. Skipped entirely when the
+        # caller already supplied name + domain - the lookup only exists to
+        # fill those in, and it costs a full submit + poll cycle.
+        profile = None
+        if not (person.first_name and person.last_name and person.domain):
+            profile = await _with_token_retry(
+                api_key,
+                lambda token: _get_profile_from_linkedin(client, token, person.linkedin_url),
             )
 
-        except httpx.TimeoutException:
-            return create_error("api_error", "Snov.io request timed out", person.linkedin_url)
-        except httpx.RequestError:
-            return create_error("api_error", "Snov.io API unavailable", person.linkedin_url)
+        # Extract name - prefer from profile, fall back to input
+        first_name = None
+        last_name = None
+        company_domain = None
+
+        if profile:
+            first_name = profile.get("first_name")
+            last_name = profile.get("last_name")
+
+            # Get company domain from positions
+            positions = profile.get("positions", [])
+            if positions:
+                company_url = positions[0].get("url")
+                company_domain = _extract_domain_from_url(company_url)
+
+        # Fall back to input data if profile didn't have info; PersonInput
+        # already split name into first/last at validation time
+        if not first_name and person.first_name:
+            first_name = person.first_name
+        if not last_name and person.last_name:
+            last_name = person.last_name
+
+        # Fall back to input domain
+        if not company_domain and person.domain:
+            company_domain = person.domain
+
+        if not first_name or not last_name:
+            return create_error("not_found", "Could not determine name from Snov.io profile", person.linkedin_url)
+
+        if not company_domain:
+            return create_error("not_found", "Could not determine company domain from Snov.io profile", person.linkedin_url)
+
+        # Step 2: Find email using name + domain
+        email = await _with_token_retry(
+            api_key,
+            lambda token: _find_email_by_name_domain(client, token, first_name, last_name, company_domain),
+        )
+
+        if not email:
+            return create_error("not_found", "No email found in Snov.io", person.linkedin_url)
+
+        # Both parts are guaranteed non-empty by the checks above, so plain
+        # concatenation needs no strip (and beats an f-string for 2 operands)
+        full_name = first_name + " " + last_name
+
+        # Extract title and company from profile
+        title = None
+        company = None
+        if profile:
+            positions = profile.get("positions", [])
+            if positions:
+                title = positions[0].get("title")
+                company = positions[0].get("name")
+
+        return create_success(
+            email=email,
+            linkedin_url=person.linkedin_url,
+            source=PROVIDER_NAME,
+            name=full_name,
+            title=title,
+            company=company,
+        )
+
+    except _TokenExpired:
+        return create_error("auth_error", "Invalid Snov.io API credentials", person.linkedin_url)
+    except httpx.TimeoutException:
+        return create_error("api_error", "Snov.io request timed out", person.linkedin_url)
+    except httpx.RequestError:
+        return create_error("api_error", "Snov.io API unavailable", person.linkedin_url)